@@ -1,12 +1,57 @@
 """Cache management for Progressive Summarization Viewer."""
 
 import os
+import re
 import json
+import queue
+import atexit
 import hashlib
+import tempfile
+import functools
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
 
+# Buffer size for cache file I/O; the 8 KiB default is small for MB-scale caches
+_IO_BUFFER_SIZE = 1 << 18
+
+# Files below this size are hashed from a single read_bytes()
+_SMALL_FILE_LIMIT = 16 * 1024 * 1024
+
+# Two or more newlines separate paragraphs
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n{2,}')
+
+# Characters replaced with '_' when deriving cache file names
+_SAFE_NAME_TABLE = str.maketrans({'.': '_', ' ': '_'})
+
+# Seconds between background flushes of caches queued with mark_dirty()
+FLUSH_INTERVAL = 5.0
+
+# Pending writes keyed by cache path: (cache, file_path, cache_dir)
+_dirty_caches: Dict[str, Tuple[Dict[str, Any], str, str]] = {}
+_dirty_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_flush_timer: Optional[threading.Timer] = None
+
+
+@functools.lru_cache(maxsize=16)
+def ensure_cache_dir(cache_dir: str) -> None:
+    """
+    Create the cache directory if needed, once per directory per process.
+
+    Args:
+        cache_dir: Directory for cache files
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=128)
 def get_cache_path(file_path: str, cache_dir: str) -> str:
     """
     Generate cache file path for a given document.
@@ -24,20 +69,23 @@ def get_cache_path(file_path: str, cache_dir: str) -> str:
     filename = Path(file_path).name
 
     # Replace dots and special chars with underscores
-    safe_name = filename.replace('.', '_')
+    safe_name = filename.translate(_SAFE_NAME_TABLE)
 
     # Create cache filename
     cache_filename = f"{safe_name}_cache.json"
 
     # Ensure cache directory exists
-    os.makedirs(cache_dir, exist_ok=True)
+    ensure_cache_dir(cache_dir)
 
     return os.path.join(cache_dir, cache_filename)
 
 
 def compute_file_hash(file_path: str) -> str:
     """
-    Compute SHA256 hash of file contents.
+    Compute BLAKE2b (128-bit) hash of file contents.
+
+    Results are memoized per (path, mtime, size), so repeated calls for an
+    unchanged file don't re-read it.
 
     Args:
         file_path: Path to file
@@ -45,14 +93,106 @@ def compute_file_hash(file_path: str) -> str:
     Returns:
         Hexadecimal hash string
     """
-    sha256 = hashlib.sha256()
+    return compute_file_hash_with_stat(file_path)[0]
 
+
+def compute_file_hash_with_stat(file_path: str) -> Tuple[str, int, int]:
+    """
+    Compute file hash together with the stat info it was computed for.
+
+    Callers store all three in cache metadata so later validity checks can
+    skip hashing while the file is unchanged.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Tuple of (hexadecimal hash, mtime_ns, size)
+    """
+    stat = os.stat(file_path)
+    file_hash = _compute_file_hash_cached(
+        file_path, stat.st_mtime_ns, stat.st_size
+    )
+    return file_hash, stat.st_mtime_ns, stat.st_size
+
+
+def read_and_hash(file_path: str) -> Tuple[str, str, int, int]:
+    """
+    Read a text file and hash it from the same single read.
+
+    The hash matches compute_file_hash() for the same file, so the result
+    can go straight into cache metadata without a second pass.
+
+    Args:
+        file_path: Path to UTF-8 text file
+
+    Returns:
+        Tuple of (text, hexadecimal hash, mtime_ns, size)
+    """
     with open(file_path, 'rb') as f:
-        # Read in chunks for large files
-        for chunk in iter(lambda: f.read(4096), b''):
-            sha256.update(chunk)
+        stat = os.fstat(f.fileno())
+        data = f.read()
+
+    file_hash = _new_hash(data).hexdigest()
+    text = data.decode('utf-8')
+    # Same newline translation a text-mode open() would apply
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    return text, file_hash, stat.st_mtime_ns, stat.st_size
+
 
-    return sha256.hexdigest()
+@functools.lru_cache(maxsize=32)
+def _compute_file_hash_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    """Hash file contents; mtime_ns and size only serve as cache keys."""
+    # Small files: a single read and a single digest update
+    if size < _SMALL_FILE_LIMIT:
+        return _new_hash(Path(file_path).read_bytes()).hexdigest()
+
+    return _hash_large_file(file_path)
+
+
+def _new_hash(data: bytes = b''):
+    """Create the content hash object; blake2b is faster than sha256 here."""
+    return hashlib.blake2b(data, digest_size=16)
+
+
+def _hash_large_file(file_path: str) -> str:
+    """
+    Hash a large file while a reader thread prefetches the next chunk.
+
+    hashlib releases the GIL on large buffers, so disk reads and digest
+    updates overlap instead of alternating.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Hexadecimal hash string
+    """
+    digest = _new_hash()
+    # Bounded so at most two chunks are buffered ahead of the hasher
+    chunks: queue.Queue = queue.Queue(maxsize=2)
+
+    def read_chunks() -> None:
+        try:
+            with open(file_path, 'rb') as f:
+                # Read in 1 MiB chunks for large files
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    chunks.put(chunk)
+        except OSError as e:
+            chunks.put(e)
+            return
+        chunks.put(None)
+
+    threading.Thread(target=read_chunks, daemon=True).start()
+
+    while (chunk := chunks.get()) is not None:
+        if isinstance(chunk, OSError):
+            raise chunk
+        digest.update(chunk)
+
+    return digest.hexdigest()
 
 
 def load_cache(file_path: str, cache_dir: str) -> Optional[Dict[str, Any]]:
@@ -68,14 +208,26 @@ def load_cache(file_path: str, cache_dir: str) -> Optional[Dict[str, Any]]:
     """
     cache_path = get_cache_path(file_path, cache_dir)
 
+    # A queued write is newer than whatever is on disk
+    with _dirty_lock:
+        pending = _dirty_caches.get(cache_path)
+    if pending is not None:
+        return pending[0]
+
     if not os.path.exists(cache_path):
         return None
 
     try:
-        with open(cache_path, 'r', encoding='utf-8') as f:
-            cache = json.load(f)
+        if orjson is not None:
+            with open(cache_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                cache = orjson.loads(f.read())
+        else:
+            with open(cache_path, 'r', encoding='utf-8',
+                      buffering=_IO_BUFFER_SIZE) as f:
+                cache = json.loads(f.read())
         return cache
-    except (json.JSONDecodeError, IOError) as e:
+    except (ValueError, IOError) as e:
+        # Both json and orjson decode errors subclass ValueError.
         # Cache corrupted, return None to trigger regeneration
         print(f"Warning: Cache corrupted ({e}), will regenerate")
         return None
@@ -85,7 +237,8 @@ def is_cache_valid(cache: Dict[str, Any], file_path: str) -> bool:
     """
     Check if cached summaries are still valid.
 
-    Compares cached hash with current file hash.
+    If the file's mtime and size match the cached metadata the file is
+    assumed unchanged; otherwise compares cached hash with current file hash.
 
     Args:
         cache: DocumentCache dictionary
@@ -97,31 +250,298 @@ def is_cache_valid(cache: Dict[str, Any], file_path: str) -> bool:
     if not cache or 'metadata' not in cache:
         return False
 
-    cached_hash = cache['metadata'].get('hash')
+    metadata = cache['metadata']
+    cached_hash = metadata.get('hash')
     if not cached_hash:
         return False
 
+    # Cheap stat check first to avoid re-hashing unchanged files
+    stat = os.stat(file_path)
+    if (metadata.get('mtime_ns') == stat.st_mtime_ns
+            and metadata.get('size') == stat.st_size):
+        return True
+
     current_hash = compute_file_hash(file_path)
 
     return cached_hash == current_hash
 
 
+def load_valid_cache(file_path: str, cache_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a document's cache if it is still valid for the source file.
+
+    Level 0 text is not stored on disk (see strip_original_text); it is
+    re-read from the source file and filled back in.
+
+    Args:
+        file_path: Path to source markdown file
+        cache_dir: Directory for cache files
+
+    Returns:
+        Complete DocumentCache, or None if the cache is missing, stale or
+        doesn't match the source paragraphs
+    """
+    cache = load_cache(file_path, cache_dir)
+    if not cache or not is_cache_valid(cache, file_path):
+        return None
+
+    # Caches written before level 0 text was stripped are already complete
+    if all('content' in chunk for chunk in cache['chunks']):
+        return cache
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        paragraphs = split_paragraphs(f.read())
+    return restore_original_text(cache, paragraphs)
+
+
+def split_paragraphs(content: str) -> List[str]:
+    """
+    Split markdown text into its non-empty, stripped paragraphs.
+
+    Level 0 chunks are these paragraphs in order, so a chunk's position is
+    its index in the returned list.
+
+    Args:
+        content: Markdown document text
+
+    Returns:
+        List of paragraph strings
+    """
+    # Split on runs of blank lines, stripping each paragraph only once
+    stripped = (p.strip() for p in _PARAGRAPH_SPLIT_RE.split(content))
+    return [p for p in stripped if p]
+
+
+def strip_original_text(cache: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a DocumentCache without the level 0 text, for writing to disk.
+
+    The paragraphs are already in the source file, whose hash the cache
+    records, so storing them again would roughly double the cache size.
+
+    Args:
+        cache: Complete DocumentCache
+
+    Returns:
+        DocumentCache whose level 0 chunks have no 'content' field
+    """
+    chunks = [
+        {key: value for key, value in chunk.items() if key != 'content'}
+        if chunk['level'] == 0 else chunk
+        for chunk in cache['chunks']
+    ]
+    return {**cache, 'chunks': chunks}
+
+
+def restore_original_text(
+    cache: Dict[str, Any],
+    paragraphs: List[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    Fill level 0 text back into a cache loaded from disk.
+
+    Caches written before level 0 text was stripped pass through unchanged.
+
+    Args:
+        cache: DocumentCache validated against the source file
+        paragraphs: Paragraphs of the source file (see split_paragraphs)
+
+    Returns:
+        Complete DocumentCache, or None if the cache doesn't match the
+        paragraphs
+    """
+    chunks = []
+    for chunk in cache['chunks']:
+        if chunk['level'] == 0 and 'content' not in chunk:
+            position = chunk['position']
+            if position >= len(paragraphs):
+                return None
+            chunk = {**chunk, 'content': paragraphs[position]}
+        chunks.append(chunk)
+
+    return {**cache, 'chunks': chunks}
+
+
+def load_caches(
+    file_paths: List[str], cache_dir: str
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Load and validate caches for several documents concurrently.
+
+    File reads and hashing release the GIL, so a small thread pool keeps
+    several I/O requests in flight.
+
+    Args:
+        file_paths: Paths to source markdown files
+        cache_dir: Directory for cache files
+
+    Returns:
+        Mapping of file path to its valid DocumentCache, or None if the
+        cache is missing or stale
+    """
+    if not file_paths:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+        caches = executor.map(
+            lambda path: load_valid_cache(path, cache_dir), file_paths
+        )
+        return dict(zip(file_paths, caches))
+
+
 def save_cache(cache: Dict[str, Any], file_path: str, cache_dir: str) -> None:
     """
     Save DocumentCache to JSON file.
 
+    The caller must already have set cache['metadata']['hash'] (see
+    read_and_hash); the file is not re-hashed here.
+
     Args:
         cache: DocumentCache dictionary
         file_path: Path to source markdown file
         cache_dir: Directory for cache files
+
+    Raises:
+        ValueError: If the cache metadata has no hash
     """
+    _require_hash(cache)
+
     cache_path = get_cache_path(file_path, cache_dir)
 
-    # Ensure cache directory exists
+    # Ensure cache directory exists (uncached: it may have been deleted
+    # to force regeneration since the path was first computed)
     os.makedirs(cache_dir, exist_ok=True)
 
+    # Write to a temp file and swap it in so a crash mid-write never
+    # leaves a truncated cache behind
+    tmp_path = cache_path + ".tmp"
+
     try:
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(tmp_path, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+                f.write(orjson.dumps(cache, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8',
+                      buffering=_IO_BUFFER_SIZE) as f:
+                json.dump(cache, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, cache_path)
     except IOError as e:
         print(f"Warning: Failed to save cache: {e}")
+
+
+def get_fragment_path(key: str, cache_dir: str) -> str:
+    """
+    Path of a cached summary fragment.
+
+    Fragments are sharded by the first two hex digits of their key:
+    .summary_cache/fragments/ab/abcdef...txt
+
+    Args:
+        key: Hex digest identifying the summarization request
+        cache_dir: Directory for cache files
+
+    Returns:
+        Path to fragment file
+    """
+    return os.path.join(cache_dir, 'fragments', key[:2], f"{key}.txt")
+
+
+def load_fragment(key: str, cache_dir: str) -> Optional[str]:
+    """
+    Load a previously generated summary fragment.
+
+    Args:
+        key: Hex digest identifying the summarization request
+        cache_dir: Directory for cache files
+
+    Returns:
+        Summary text or None if not cached (or the fragment is empty)
+    """
+    try:
+        with open(get_fragment_path(key, cache_dir), 'r', encoding='utf-8') as f:
+            return f.read() or None
+    except FileNotFoundError:
+        return None
+    except (IOError, UnicodeDecodeError) as e:
+        print(f"Warning: Failed to read summary fragment ({e}), will regenerate")
+        return None
+
+
+def save_fragment(key: str, text: str, cache_dir: str) -> None:
+    """
+    Store a generated summary fragment.
+
+    Written to a unique temp file and renamed into place, so concurrent
+    writers of the same key never expose a partial file.
+
+    Args:
+        key: Hex digest identifying the summarization request
+        text: Summary text
+        cache_dir: Directory for cache files
+    """
+    fragment_path = get_fragment_path(key, cache_dir)
+    fragment_dir = os.path.dirname(fragment_path)
+
+    try:
+        os.makedirs(fragment_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=fragment_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, fragment_path)
+    except IOError as e:
+        print(f"Warning: Failed to save summary fragment: {e}")
+
+
+def mark_dirty(cache: Dict[str, Any], file_path: str, cache_dir: str) -> None:
+    """
+    Queue a DocumentCache to be written by the next flush.
+
+    Writes are batched so a cache updated several times in a row is only
+    rewritten once; pending caches are flushed at most every FLUSH_INTERVAL
+    seconds and always at interpreter exit.
+
+    Args:
+        cache: DocumentCache dictionary
+        file_path: Path to source markdown file
+        cache_dir: Directory for cache files
+
+    Raises:
+        ValueError: If the cache metadata has no hash
+    """
+    global _flush_timer
+
+    _require_hash(cache)
+    cache_path = get_cache_path(file_path, cache_dir)
+
+    with _dirty_lock:
+        _dirty_caches[cache_path] = (cache, file_path, cache_dir)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(FLUSH_INTERVAL, flush_all_caches)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_all_caches() -> None:
+    """Write every cache queued with mark_dirty() to disk."""
+    global _flush_timer
+
+    # Serialize flushes so the timer thread and atexit never race on a file
+    with _flush_lock:
+        with _dirty_lock:
+            pending = list(_dirty_caches.values())
+            _dirty_caches.clear()
+            if _flush_timer is not None:
+                _flush_timer.cancel()
+                _flush_timer = None
+
+        for cache, file_path, cache_dir in pending:
+            save_cache(cache, file_path, cache_dir)
+
+
+atexit.register(flush_all_caches)
+
+
+def _require_hash(cache: Dict[str, Any]) -> None:
+    """Raise ValueError if the cache metadata has no file hash."""
+    if not cache.get('metadata', {}).get('hash'):
+        raise ValueError("Cache metadata must include the file hash before saving")
@@ -1,10 +1,16 @@
 """Configuration management for Progressive Summarization Viewer."""
 
 import os
+import json
+import tempfile
+import functools
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+# Fields that must be present in config.yaml
+_REQUIRED_FIELDS = frozenset({'openrouter_api_key', 'model', 'abstraction_levels'})
+
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """
@@ -26,18 +32,35 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
             "Please create a config.yaml file with your settings."
         )
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+    return _load_config_cached(config_path, os.stat(config_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse and validate config.yaml, memoized per (path, mtime).
+
+    Args:
+        config_path: Path to config.yaml file
+        mtime_ns: Modification time of the file, used as cache key
+
+    Returns:
+        Dictionary containing configuration settings
+    """
+    config = _read_config_file(config_path, mtime_ns)
 
     # Validate required fields
-    required_fields = ['openrouter_api_key', 'model', 'abstraction_levels']
-    for field in required_fields:
-        if field not in config:
-            raise ValueError(f"Missing required config field: {field}")
+    missing = _REQUIRED_FIELDS - config.keys()
+    if missing:
+        raise ValueError(f"Missing required config fields: {', '.join(sorted(missing))}")
 
     # Set defaults for optional fields
     config.setdefault('chunk_strategy', 'paragraph')
     config.setdefault('group_size', 5)
+    config.setdefault('batch_groups', 4)
+    config.setdefault('requests_per_second', 10)
+    config.setdefault('max_concurrency', 10)
+    config.setdefault('tokens_per_minute', None)
     config.setdefault('cache_dir', '.summary_cache')
     config.setdefault('window_width', 800)
     config.setdefault('window_height', 600)
@@ -50,6 +73,18 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     if config['group_size'] < 2:
         raise ValueError("group_size must be >= 2")
 
+    if config['batch_groups'] < 1:
+        raise ValueError("batch_groups must be >= 1")
+
+    if config['requests_per_second'] <= 0:
+        raise ValueError("requests_per_second must be > 0")
+
+    if config['max_concurrency'] < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    if config['tokens_per_minute'] is not None and config['tokens_per_minute'] <= 0:
+        raise ValueError("tokens_per_minute must be > 0")
+
     # Check API key
     if not config['openrouter_api_key'] or config['openrouter_api_key'] == "":
         # Try environment variable
@@ -65,6 +100,66 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     return config
 
 
+def _read_config_file(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse config.yaml, reusing a JSON snapshot of a previous parse.
+
+    The snapshot (config.yaml.cache) holds the raw parsed YAML, before
+    defaults and the API key environment fallback are applied, and is only
+    used while its recorded mtime matches the YAML file.
+
+    Args:
+        config_path: Path to config.yaml file
+        mtime_ns: Modification time of the YAML file
+
+    Returns:
+        Raw configuration dictionary as written in the file
+    """
+    snapshot_path = config_path + '.cache'
+
+    try:
+        with open(snapshot_path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        if snapshot['mtime_ns'] == mtime_ns:
+            return snapshot['config']
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, stale or unreadable snapshot: parse the YAML instead
+        pass
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        config = yaml.load(f, Loader=loader)
+
+    # Serialize first, so a YAML value JSON can't represent (dates, ...)
+    # never leaves a partial file holding the API key behind
+    try:
+        data = json.dumps({'mtime_ns': mtime_ns, 'config': config})
+    except (TypeError, ValueError):
+        return config
+
+    # mkstemp creates the file 0600: the snapshot holds the API key, so it
+    # must not be more readable than a locked-down config.yaml
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(snapshot_path)),
+            prefix=os.path.basename(snapshot_path) + '.', suffix='.tmp'
+        )
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_path, snapshot_path)
+    except OSError:
+        # Not fatal (read-only dir, full disk, ...); drop any partial file
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    return config
+
+
 def get_api_key(config: Dict[str, Any]) -> str:
     """
     Get API key from config with environment variable fallback.
@@ -1,8 +1,6 @@
 """Entry point for Progressive Summarization Viewer."""
 
 import sys
-import tkinter as tk
-from tkinter import filedialog, messagebox, ttk
 import threading
 from pathlib import Path
 
@@ -10,81 +8,33 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import load_config
-from processor import process_file
-from viewer import SummaryViewer
-
-
-class ModernLoadingDialog(tk.Toplevel):
-    """Modern loading dialog with better styling."""
-
-    def __init__(self, parent):
-        """
-        Initialize modern loading dialog.
-
-        Args:
-            parent: Parent window
-        """
-        super().__init__(parent)
-        self.title("Processing...")
-        self.geometry("400x220")
-        self.resizable(False, False)
-
-        # Center the window
-        self.transient(parent)
-        self.grab_set()
-
-        # Set colors
-        self.bg_primary = "#ffffff"
-        self.bg_secondary = "#f8f9fa"
-        self.accent = "#0d6efd"
-        self.config(bg=self.bg_primary)
-
-        # Main frame with padding
-        main_frame = tk.Frame(self, bg=self.bg_primary)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
-
-        # Title
-        title = tk.Label(
-            main_frame, text="Processing Document", bg=self.bg_primary,
-            fg="#1a1a1a", font=("Segoe UI", 14, "bold")
-        )
-        title.pack(anchor=tk.W, pady=(0, 10))
 
-        # Subtitle
-        subtitle = tk.Label(
-            main_frame, text="Generating summaries at multiple abstraction levels...",
-            bg=self.bg_primary, fg="#6c757d", font=("Segoe UI", 9)
-        )
-        subtitle.pack(anchor=tk.W, pady=(0, 20))
+# Tk, the processor (openai) and the viewer are imported lazily inside the
+# functions below so a config error can be reported without loading them.
 
-        # Progress bar
-        self.progress = ttk.Progressbar(
-            main_frame, mode='indeterminate', length=340
-        )
-        self.progress.pack(fill=tk.X, pady=(0, 15))
-        self.progress.start(10)
 
-        # Status message
-        self.status_label = tk.Label(
-            main_frame, text="Starting processing...", bg=self.bg_primary,
-            fg="#6c757d", font=("Segoe UI", 9), justify=tk.LEFT
-        )
-        self.status_label.pack(anchor=tk.W)
+# Hidden Tk root shared by show_error() and the file picker, so at most one
+# Tk interpreter exists before the viewer starts
+_hidden_root = None
 
-        # Cancel button
-        button_frame = tk.Frame(main_frame, bg=self.bg_primary)
-        button_frame.pack(fill=tk.X, pady=(20, 0))
 
-        self.cancel_button = tk.Button(
-            button_frame, text="Cancel", bg=self.bg_secondary,
-            fg="#1a1a1a", font=("Segoe UI", 9), padx=15, pady=6,
-            relief=tk.FLAT, cursor="hand2"
-        )
-        self.cancel_button.pack(anchor=tk.E)
+def _get_hidden_root():
+    """Return the shared hidden Tk root, creating it on first use."""
+    global _hidden_root
+    import tkinter as tk
 
-    def update_message(self, message: str):
-        """Update the loading message."""
-        self.status_label.config(text=message)
+    if _hidden_root is None:
+        _hidden_root = tk.Tk()
+        _hidden_root.withdraw()  # Hide main window
+    return _hidden_root
+
+
+def _destroy_hidden_root():
+    """Destroy the shared hidden Tk root if it exists."""
+    global _hidden_root
+    if _hidden_root is not None:
+        _hidden_root.destroy()
+        _hidden_root = None
 
 
 def show_error(title: str, message: str):
@@ -95,10 +45,9 @@ def show_error(title: str, message: str):
         title: Error dialog title
         message: Error message
     """
-    root = tk.Tk()
-    root.withdraw()  # Hide main window
-    messagebox.showerror(title, message)
-    root.destroy()
+    from tkinter import messagebox
+
+    messagebox.showerror(title, message, parent=_get_hidden_root())
 
 
 def main():
@@ -114,9 +63,14 @@ def main():
             show_error("Configuration Error", str(e))
             return
 
-        # Create temporary root for file dialog
-        root = tk.Tk()
-        root.withdraw()  # Hide the root window
+        from tkinter import filedialog
+
+        from dialogs import ModernLoadingDialog
+        from processor import process_file
+        from viewer import SummaryViewer
+
+        # Hidden root for the file dialog
+        root = _get_hidden_root()
 
         # Show file picker
         file_path = filedialog.askopenfilename(
@@ -129,13 +83,13 @@ def main():
 
         if not file_path:
             # User cancelled
-            root.destroy()
+            _destroy_hidden_root()
             return
 
         # Validate file
         if not Path(file_path).exists():
             show_error("File Error", f"File not found: {file_path}")
-            root.destroy()
+            _destroy_hidden_root()
             return
 
         # Show loading dialog
@@ -144,20 +98,22 @@ def main():
         # Process file in background thread
         document_cache = None
         error = None
-        processing_done = False
+        done_event = threading.Event()
 
         def process_thread():
-            nonlocal document_cache, error, processing_done
+            nonlocal document_cache, error
             try:
                 document_cache = process_file(file_path, config)
             except Exception as e:
                 error = e
             finally:
-                processing_done = True
+                done_event.set()
 
         def check_processing():
             """Poll to see if processing is complete."""
-            if processing_done:
+            # Tk calls stay on this thread: wait_window is not mainloop(),
+            # so the worker cannot post events to the interpreter itself
+            if done_event.is_set():
                 loading.progress.stop()  # Stop progress bar animation
                 loading.destroy()
             else:
@@ -180,7 +136,7 @@ def main():
                 "Processing Error",
                 f"Failed to process file:\n{str(error)}"
             )
-            root.destroy()
+            _destroy_hidden_root()
             return
 
         if not document_cache:
@@ -188,11 +144,11 @@ def main():
                 "Processing Error",
                 "Failed to process file (no cache generated)"
             )
-            root.destroy()
+            _destroy_hidden_root()
             return
 
-        # Close temporary root
-        root.destroy()
+        # Close hidden root so the viewer is the only Tk instance
+        _destroy_hidden_root()
 
         # Launch viewer
         viewer = SummaryViewer(document_cache, config)
@@ -1,24 +1,87 @@
 """Markdown processing and summarization logic."""
 
 import asyncio
+import hashlib
+import math
+import random
+import re
 import time
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+import httpx
 import openai
 from openai import AsyncOpenAI
 
 from cache_manager import (
-    load_cache,
-    is_cache_valid,
-    save_cache,
-    compute_file_hash
+    load_valid_cache,
+    mark_dirty,
+    read_and_hash,
+    split_paragraphs,
+    strip_original_text,
+    load_fragment,
+    save_fragment
 )
 
 
-# Type aliases for clarity
-Chunk = Dict[str, Any]
+@dataclass(slots=True)
+class Chunk:
+    """A node in the summary tree (level 0 = original paragraph)."""
+    id: str
+    level: int
+    content: str
+    parent_id: Optional[str]
+    child_ids: List[str]
+    position: int
+
+
+# Type aliases for clarity; chunks are stored as plain dicts (asdict(Chunk))
 DocumentCache = Dict[str, Any]
 
+# Fixed parts of the single-group prompt; only the sections vary per call
+_SUMMARIZE_PREFIX = (
+    "Summarize the following text sections into a single coherent summary.\n"
+    "Preserve key information and maintain logical flow.\n\n"
+)
+_SUMMARIZE_SUFFIX = "\n\nProvide only the summary, no preamble."
+
+# Instructions shared by every batched prompt
+_BATCH_INSTRUCTIONS = (
+    "Summarize each block separately into a single coherent summary.\n"
+    "Preserve key information and maintain logical flow.\n\n"
+)
+
+# Marker line preceding each summary in a batched response
+_BATCH_MARKER_RE = re.compile(r'^[ \t]*---SUMMARY (\d+)---[ \t]*$', re.MULTILINE)
+
+# Completion tokens reserved per requested summary; output counts against
+# tokens_per_minute just like the prompt does
+_SUMMARY_TOKEN_ALLOWANCE = 300
+
+# Completed summaries keyed by _summary_key(); reused across tree builds
+_SUMMARY_CACHE: Dict[str, str] = {}
+
+# Requests currently in flight, so identical concurrent prompts share a call
+_IN_FLIGHT: Dict[str, "asyncio.Future[str]"] = {}
+
+
+class _EmptyCompletionError(Exception):
+    """The API returned a completion with no text."""
+
+
+# Transient API errors worth retrying; anything else (bad request, auth, ...)
+# fails immediately. APITimeoutError is a subclass of APIConnectionError.
+# A connection dropped while reading the stream surfaces as a raw httpx
+# transport error, which the SDK doesn't wrap. An empty completion is
+# retried rather than cached.
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    httpx.TransportError,
+    _EmptyCompletionError,
+)
+
 
 def parse_markdown(file_path: str) -> List[Chunk]:
     """
@@ -28,28 +91,38 @@ def parse_markdown(file_path: str) -> List[Chunk]:
         file_path: Path to markdown file
 
     Returns:
-        List of level 0 Chunk dictionaries
+        List of level 0 Chunks
     """
     with open(file_path, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Split by double newlines to get paragraphs
-    paragraphs = [p.strip() for p in content.split('\n\n') if p.strip()]
+    return parse_markdown_text(content)
 
-    # Create level 0 chunks
-    chunks = []
-    for idx, para in enumerate(paragraphs):
-        chunk = {
-            "id": f"chunk_{idx}",
-            "level": 0,
-            "content": para,
-            "parent_id": None,
-            "child_ids": [],
-            "position": idx
-        }
-        chunks.append(chunk)
 
-    return chunks
+def parse_markdown_text(content: str) -> List[Chunk]:
+    """
+    Parse markdown text into level 0 chunks (paragraphs).
+
+    Args:
+        content: Markdown document text
+
+    Returns:
+        List of level 0 Chunks
+    """
+    paragraphs = split_paragraphs(content)
+
+    # Create level 0 chunks; id and position come from the same counter
+    return [
+        Chunk(
+            id=f"chunk_{idx}",
+            level=0,
+            content=para,
+            parent_id=None,
+            child_ids=[],
+            position=idx
+        )
+        for idx, para in enumerate(paragraphs)
+    ]
 
 
 def group_chunks(chunks: List[Chunk], group_size: int = 5) -> List[List[Chunk]]:
@@ -71,84 +144,518 @@ def group_chunks(chunks: List[Chunk], group_size: int = 5) -> List[List[Chunk]]:
     return groups
 
 
+class AsyncRateLimiter:
+    """Spaces request starts evenly across all tasks sharing the limiter.
+
+    With a token budget it also meters estimated prompt tokens, so requests
+    wait for capacity up front instead of running into 429 responses.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float,
+        tokens_per_minute: Optional[float] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_second: Maximum sustained request rate
+            tokens_per_minute: Maximum sustained token rate (None for no limit)
+        """
+        self._interval = 1.0 / requests_per_second
+        self._next_slot = 0.0
+        self._token_rate = tokens_per_minute / 60.0 if tokens_per_minute else None
+        self._token_capacity = tokens_per_minute or 0.0
+        self._tokens = self._token_capacity
+        self._last_refill: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until the next request slot (and token capacity) is available.
+
+        Args:
+            tokens: Estimated tokens the request will use
+        """
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = max(0.0, self._next_slot - now)
+            self._next_slot = max(now, self._next_slot) + self._interval
+
+            if self._token_rate and tokens:
+                # Refill the bucket, then reserve; a deficit becomes a wait
+                if self._last_refill is not None:
+                    elapsed = now - self._last_refill
+                    self._tokens = min(
+                        self._token_capacity,
+                        self._tokens + elapsed * self._token_rate
+                    )
+                self._last_refill = now
+                self._tokens -= tokens
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._token_rate)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+def create_client(api_key: str) -> AsyncOpenAI:
+    """
+    Create an async OpenRouter client.
+
+    One client is shared by all requests of a tree build so its HTTP
+    connection pool (and TLS sessions) are reused.
+
+    Args:
+        api_key: OpenRouter API key
+
+    Returns:
+        AsyncOpenAI client pointed at OpenRouter
+    """
+    return AsyncOpenAI(
+        base_url="https://openrouter.ai/api/v1",
+        api_key=api_key
+    )
+
+
 async def summarize_chunk_group(
     chunks: List[Chunk],
-    api_key: str,
+    client: AsyncOpenAI,
     model: str,
-    next_chunk_id: int
+    next_chunk_id: int,
+    cache_dir: Optional[str] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None
 ) -> Chunk:
     """
     Summarize a group of chunks using OpenRouter API.
 
     Args:
         chunks: List of chunks to summarize together
-        api_key: OpenRouter API key
+        client: Shared OpenRouter client (see create_client)
         model: Model name (e.g., "google/gemini-2.0-flash-exp:free")
         next_chunk_id: ID counter for new chunk
+        cache_dir: Directory for persisted summary fragments (None to skip)
+        rate_limiter: Limiter charged if a request is sent (None for none)
 
     Returns:
         New summary Chunk with level+1
     """
-    # Build prompt with all chunk contents
-    chunk_texts = [f"Section {i+1}:\n{chunk['content']}" for i, chunk in enumerate(chunks)]
-    combined_text = "\n\n".join(chunk_texts)
+    if len(chunks) == 1:
+        # Nothing to condense; carry the lone chunk's content up a level
+        return _make_summary_chunk(chunks, next_chunk_id, chunks[0].content)
 
-    prompt = f"""Summarize the following text sections into a single coherent summary.
-Preserve key information and maintain logical flow.
+    prompt = _build_group_prompt(chunks)
+    summary_text = await _summarize_prompt(
+        client, model, prompt, cache_dir, rate_limiter
+    )
+    return _make_summary_chunk(chunks, next_chunk_id, summary_text)
 
-{combined_text}
 
-Provide only the summary, no preamble."""
+async def summarize_chunk_groups(
+    groups: List[List[Chunk]],
+    client: AsyncOpenAI,
+    model: str,
+    next_chunk_id: int,
+    cache_dir: Optional[str] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None
+) -> List[Chunk]:
+    """
+    Summarize several chunk groups with a single API request.
+
+    Single-chunk groups pass their content through and groups whose summary
+    is already cached are skipped; the rest are packed into one prompt
+    asking for one delimited summary per group. If the response can't be
+    split into the expected number of summaries, each remaining group falls
+    back to its own request. Groups already being summarized by another
+    task wait for that request instead. Only requests actually sent are
+    charged to rate_limiter, for the tokens of the prompt they send.
 
-    # Initialize async OpenAI client
-    client = AsyncOpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key=api_key
+    Args:
+        groups: Consecutive chunk groups at the same level
+        client: Shared OpenRouter client (see create_client)
+        model: Model name
+        next_chunk_id: ID for the first new chunk; the rest follow in order
+        cache_dir: Directory for persisted summary fragments (None to skip)
+        rate_limiter: Limiter charged per request sent (None for no limit)
+
+    Returns:
+        One new summary Chunk per group, in group order
+    """
+    summaries: List[Optional[str]] = []
+    prompts: List[Optional[str]] = []
+    keys: List[Optional[str]] = []
+    for group in groups:
+        if len(group) == 1:
+            # Nothing to condense; carry the lone chunk's content up a level
+            summaries.append(group[0].content)
+            prompts.append(None)
+            keys.append(None)
+            continue
+        prompt = _build_group_prompt(group)
+        key = _summary_key(prompt, model)
+        summaries.append(_lookup_summary(key, cache_dir))
+        prompts.append(prompt)
+        keys.append(key)
+    missing = [i for i, summary in enumerate(summaries) if summary is None]
+
+    # Share requests already in flight elsewhere (and repeats within this
+    # call) instead of sending the same group twice
+    send: List[int] = []
+    shared: Dict[int, "asyncio.Future[str]"] = {}
+    repeats: Dict[int, int] = {}
+    first_index: Dict[str, int] = {}
+    for i in missing:
+        key = keys[i]
+        if key in first_index:
+            repeats[i] = first_index[key]
+            continue
+        first_index[key] = i
+        pending = _IN_FLIGHT.get(key)
+        if pending is not None:
+            shared[i] = pending
+        else:
+            send.append(i)
+
+    if len(send) == 1:
+        i = send[0]
+        summaries[i] = await _summarize_prompt(
+            client, model, prompts[i], cache_dir, rate_limiter
+        )
+    elif send:
+        sent = await _summarize_batch(
+            [groups[i] for i in send], [prompts[i] for i in send],
+            [keys[i] for i in send], client, model, cache_dir, rate_limiter
+        )
+        for i, summary in zip(send, sent):
+            summaries[i] = summary
+
+    for i, pending in shared.items():
+        # Shield so a cancelled waiter doesn't cancel the shared request
+        summaries[i] = await asyncio.shield(pending)
+    for i, first in repeats.items():
+        summaries[i] = summaries[first]
+
+    return [
+        _make_summary_chunk(group, next_chunk_id + i, summary)
+        for i, (group, summary) in enumerate(zip(groups, summaries))
+    ]
+
+
+async def _summarize_batch(
+    groups: List[List[Chunk]],
+    prompts: List[str],
+    keys: List[str],
+    client: AsyncOpenAI,
+    model: str,
+    cache_dir: Optional[str],
+    rate_limiter: Optional[AsyncRateLimiter]
+) -> List[str]:
+    """
+    Summarize several groups with one request, registered as in flight.
+
+    Each group's key is entered in _IN_FLIGHT for the duration, so identical
+    groups requested concurrently elsewhere wait for this request. If the
+    response can't be split, the groups are sent one at a time.
+
+    Args:
+        groups: Chunk groups to summarize, none cached or in flight
+        prompts: Single-group prompt of each group
+        keys: Summary key of each group's prompt
+        client: Shared OpenRouter client
+        model: Model name
+        cache_dir: Directory for persisted summary fragments (None to skip)
+        rate_limiter: Limiter charged per request sent (None for no limit)
+
+    Returns:
+        One summary per group, in group order
+    """
+    loop = asyncio.get_running_loop()
+    futures = [loop.create_future() for _ in keys]
+    for key, future in zip(keys, futures):
+        _IN_FLIGHT[key] = future
+    try:
+        batch_prompt = _build_batch_prompt(groups)
+        if rate_limiter is not None:
+            await rate_limiter.acquire(_estimate_tokens(batch_prompt, len(groups)))
+        response = await _request_summary(client, model, batch_prompt)
+        summaries = _split_batch_response(response, len(groups))
+
+        if summaries is None:
+            print(f"Batch response malformed, summarizing {len(groups)} groups individually")
+            # One at a time, each rate limited, so a worker never has more
+            # than one request in flight
+            summaries = []
+            for prompt in prompts:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire(_estimate_tokens(prompt))
+                summaries.append(await _request_summary(client, model, prompt))
+
+        for key, summary in zip(keys, summaries):
+            _store_summary(key, summary, cache_dir)
+    except asyncio.CancelledError:
+        for future in futures:
+            future.cancel()
+        raise
+    except Exception as e:
+        for future in futures:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved; waiters (if any) re-raise it
+        raise
+    finally:
+        for key in keys:
+            del _IN_FLIGHT[key]
+
+    for future, summary in zip(futures, summaries):
+        future.set_result(summary)
+    return summaries
+
+
+def _format_sections(chunks: List[Chunk]) -> str:
+    """Join chunk contents as numbered sections."""
+    return "\n\n".join(
+        f"Section {i+1}:\n{chunk.content}" for i, chunk in enumerate(chunks)
+    )
+
+
+def _build_group_prompt(chunks: List[Chunk]) -> str:
+    """Build the prompt summarizing one chunk group."""
+    return _SUMMARIZE_PREFIX + _format_sections(chunks) + _SUMMARIZE_SUFFIX
+
+
+def _build_batch_prompt(groups: List[List[Chunk]]) -> str:
+    """Build one prompt asking for a separate summary of each group."""
+    count = len(groups)
+    blocks = "\n\n".join(
+        f"<<<BLOCK {i+1}>>>\n{_format_sections(group)}"
+        for i, group in enumerate(groups)
+    )
+
+    return f"""The following {count} blocks each contain text sections.
+{_BATCH_INSTRUCTIONS}{blocks}
+
+Output exactly {count} summaries in block order. Start each one with a line
+containing only its marker, ---SUMMARY 1--- through ---SUMMARY {count}---.
+Provide only the markers and summaries, no preamble."""
+
+
+def _split_batch_response(response: str, count: int) -> Optional[List[str]]:
+    """
+    Split a batched response into its per-block summaries.
+
+    Returns:
+        List of `count` summaries, or None if the markers are missing,
+        out of order or any summary is empty
+    """
+    markers = list(_BATCH_MARKER_RE.finditer(response))
+    if [int(m.group(1)) for m in markers] != list(range(1, count + 1)):
+        return None
+
+    ends = [m.start() for m in markers[1:]] + [len(response)]
+    summaries = [
+        response[m.end():end].strip() for m, end in zip(markers, ends)
+    ]
+    if not all(summaries):
+        return None
+    return summaries
+
+
+def _make_summary_chunk(chunks: List[Chunk], chunk_id: int, summary_text: str) -> Chunk:
+    """Create the parent Chunk for a summarized group and link its children."""
+    # Create new chunk
+    new_chunk = Chunk(
+        id=f"chunk_{chunk_id}",
+        level=chunks[0].level + 1,
+        content=summary_text,
+        parent_id=None,  # Will be set if there's a higher level
+        child_ids=[chunk.id for chunk in chunks],
+        position=chunks[0].position  # Use first chunk's position
     )
 
+    # Update children to point to this parent
+    for chunk in chunks:
+        chunk.parent_id = new_chunk.id
+
+    return new_chunk
+
+
+def _summary_key(prompt: str, model: str) -> str:
+    """Stable hex key identifying a summarization request."""
+    return hashlib.blake2b(
+        model.encode("utf-8") + b"\x00" + prompt.encode("utf-8"),
+        digest_size=16
+    ).hexdigest()
+
+
+async def _summarize_prompt(
+    client: AsyncOpenAI,
+    model: str,
+    prompt: str,
+    cache_dir: Optional[str] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None
+) -> str:
+    """
+    Get the summary for a prompt, reusing identical earlier or in-flight requests.
+
+    Lookup order: in-process cache, in-flight requests, fragments persisted
+    in cache_dir, then the API.
+
+    Args:
+        client: Shared OpenRouter client
+        model: Model name
+        prompt: Full summarization prompt
+        cache_dir: Directory for persisted summary fragments (None to skip)
+        rate_limiter: Limiter charged only if the API is called (None for none)
+
+    Returns:
+        Summary text
+    """
+    key = _summary_key(prompt, model)
+
+    pending = _IN_FLIGHT.get(key)
+    if pending is not None:
+        # Shield so a cancelled waiter doesn't cancel the shared request
+        return await asyncio.shield(pending)
+
+    cached = _lookup_summary(key, cache_dir)
+    if cached is not None:
+        return cached
+
+    future = asyncio.get_running_loop().create_future()
+    _IN_FLIGHT[key] = future
+    try:
+        if rate_limiter is not None:
+            await rate_limiter.acquire(_estimate_tokens(prompt))
+        summary_text = await _request_summary(client, model, prompt)
+        _store_summary(key, summary_text, cache_dir)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved; waiters (if any) re-raise it
+        raise
+    finally:
+        del _IN_FLIGHT[key]
+
+    future.set_result(summary_text)
+    return summary_text
+
+
+def _estimate_tokens(prompt: str, summaries: int = 1) -> int:
+    """
+    Rough token count of a request: prompt plus expected output.
+
+    Args:
+        prompt: Prompt text, counted at about four characters per token
+        summaries: Number of summaries the response will contain
+
+    Returns:
+        Estimated total tokens
+    """
+    return len(prompt) // 4 + summaries * _SUMMARY_TOKEN_ALLOWANCE
+
+
+def _lookup_summary(key: str, cache_dir: Optional[str]) -> Optional[str]:
+    """Find a summary in the in-process cache or the persisted fragments."""
+    cached = _SUMMARY_CACHE.get(key)
+    if not cached and cache_dir is not None:
+        cached = load_fragment(key, cache_dir)
+        if cached:
+            _SUMMARY_CACHE[key] = cached
+    # An empty summary is never valid; treat it as a miss
+    return cached or None
+
+
+def _store_summary(key: str, summary_text: str, cache_dir: Optional[str]) -> None:
+    """Record a summary in the in-process cache and the persisted fragments."""
+    if not summary_text:
+        return
+    _SUMMARY_CACHE[key] = summary_text
+    if cache_dir is not None:
+        save_fragment(key, summary_text, cache_dir)
+
+
+async def _request_summary(client: AsyncOpenAI, model: str, prompt: str) -> str:
+    """
+    Send a summarization prompt to the API with retry logic.
+
+    Args:
+        client: Shared OpenRouter client
+        model: Model name
+        prompt: Full summarization prompt
+
+    Returns:
+        Summary text
+
+    Raises:
+        RuntimeError: If all retries fail
+    """
     # Call API with retry logic
-    max_retries = 3
+    max_retries = 5
+    max_wait = 30.0
     for attempt in range(max_retries):
         try:
-            response = await client.chat.completions.create(
+            # Stream the completion so tokens are consumed as they arrive
+            stream = await client.chat.completions.create(
                 model=model,
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                stream=True
             )
 
-            summary_text = response.choices[0].message.content.strip()
-
-            # Create new chunk
-            new_chunk = {
-                "id": f"chunk_{next_chunk_id}",
-                "level": chunks[0]["level"] + 1,
-                "content": summary_text,
-                "parent_id": None,  # Will be set if there's a higher level
-                "child_ids": [chunk["id"] for chunk in chunks],
-                "position": chunks[0]["position"]  # Use first chunk's position
-            }
+            parts = []
+            async for event in stream:
+                if event.choices and event.choices[0].delta.content:
+                    parts.append(event.choices[0].delta.content)
 
-            # Update children to point to this parent
-            for chunk in chunks:
-                chunk["parent_id"] = new_chunk["id"]
-
-            return new_chunk
+            summary_text = "".join(parts).strip()
+            if not summary_text:
+                # Never cache or return an empty summary; ask again
+                raise _EmptyCompletionError("API returned an empty completion")
+            return summary_text
 
         except Exception as e:
+            if not _is_retryable(e):
+                raise RuntimeError(f"Failed to summarize chunk group: {e}") from e
             if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # Exponential backoff
+                # Randomized exponential backoff so concurrent workers that
+                # failed together don't all retry in the same instant
+                wait_time = random.uniform(1, min(max_wait, 2 ** (attempt + 1)))
                 print(f"API error (attempt {attempt+1}/{max_retries}): {e}")
-                print(f"Retrying in {wait_time}s...")
+                print(f"Retrying in {wait_time:.1f}s...")
                 await asyncio.sleep(wait_time)
             else:
                 raise RuntimeError(f"Failed to summarize chunk group after {max_retries} attempts: {e}")
 
 
+def _is_retryable(error: Exception) -> bool:
+    """
+    Check whether a failed request is worth retrying.
+
+    Besides _RETRYABLE_ERRORS, a bare APIError (an error event received
+    mid-stream) is retried; other status errors such as 4xx fail fast.
+    """
+    if isinstance(error, _RETRYABLE_ERRORS):
+        return True
+    return (
+        isinstance(error, openai.APIError)
+        and not isinstance(error, openai.APIStatusError)
+    )
+
+
 async def build_summary_tree(
     level_0_chunks: List[Chunk],
     api_key: str,
     model: str,
     max_level: int,
-    group_size: int = 5
+    group_size: int = 5,
+    cache_dir: Optional[str] = None,
+    batch_groups: int = 4,
+    requests_per_second: float = 10.0,
+    max_concurrency: int = 10,
+    tokens_per_minute: Optional[float] = None,
+    client: Optional[AsyncOpenAI] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+    request_slots: Optional[asyncio.Semaphore] = None
 ) -> List[Chunk]:
     """
     Build summary tree using bottom-up algorithm.
@@ -159,61 +666,240 @@ async def build_summary_tree(
         model: Model name
         max_level: Maximum abstraction level
         group_size: Chunks per summary group
+        cache_dir: Directory for persisted summary fragments (None to skip)
+        batch_groups: Groups packed into each API request
+        requests_per_second: Rate limit shared by all requests
+        max_concurrency: Maximum number of requests in flight at once
+        tokens_per_minute: Token rate limit shared by all requests (None for none)
+        client: Existing client to use instead of creating (and closing) one
+        rate_limiter: Existing limiter to share instead of creating one from
+            requests_per_second and tokens_per_minute
+        request_slots: Existing semaphore to share instead of creating one
+            from max_concurrency
 
     Returns:
         Flat list of all chunks (all levels combined)
     """
-    all_chunks = level_0_chunks.copy()
-    current_level_chunks = level_0_chunks.copy()
-    next_chunk_id = len(level_0_chunks)  # Start IDs after level 0
+    if rate_limiter is None:
+        rate_limiter = AsyncRateLimiter(requests_per_second, tokens_per_minute)
+    if request_slots is None:
+        request_slots = asyncio.Semaphore(max_concurrency)
+
+    owns_client = client is None
+    if owns_client:
+        client = create_client(api_key)
+    try:
+        return await _build_levels(
+            level_0_chunks, client, model, max_level, group_size, cache_dir,
+            batch_groups, rate_limiter, request_slots, max_concurrency
+        )
+    finally:
+        if owns_client:
+            await client.close()
+
+
+async def _build_levels(
+    level_0_chunks: List[Chunk],
+    client: AsyncOpenAI,
+    model: str,
+    max_level: int,
+    group_size: int,
+    cache_dir: Optional[str],
+    batch_groups: int,
+    rate_limiter: AsyncRateLimiter,
+    request_slots: asyncio.Semaphore,
+    max_concurrency: int
+) -> List[Chunk]:
+    """
+    Summarize all levels as one dependency graph; see build_summary_tree.
 
-    current_level = 0
+    A batch of groups at level L+1 becomes ready as soon as its own children
+    at level L are done, instead of waiting for the whole of level L, so one
+    slow request no longer stalls every group above it. A fixed pool of
+    workers pulls ready batches from a queue, so memory stays bounded by the
+    number of ready batches rather than one task per group.
+    """
+    # Plan the tree shape: number of chunks at each level
+    level_sizes = [len(level_0_chunks)]
+    while len(level_sizes) - 1 < max_level and level_sizes[-1] > 1:
+        level_sizes.append(math.ceil(level_sizes[-1] / group_size))
+
+    # Children consumed by one batch (batch_groups groups of group_size)
+    batch_span = group_size * batch_groups
+
+    # One flat list preallocated for the whole tree and filled in place.
+    # Level N occupies level_ranges[N]; IDs continue level by level in group
+    # order, so a chunk's index in all_chunks is also its ID number
+    all_chunks: List[Optional[Chunk]] = [None] * sum(level_sizes)
+    all_chunks[:level_sizes[0]] = level_0_chunks
+    level_ranges: List[Tuple[int, int]] = []
+    offset = 0
+    for size in level_sizes:
+        level_ranges.append((offset, offset + size))
+        offset += size
+
+    # Per level and batch: children still pending before the batch is ready
+    pending_children: List[List[int]] = [[]]
+    pending_batches = [0]
+
+    for level in range(1, len(level_sizes)):
+        child_count = level_sizes[level - 1]
+        batch_count = math.ceil(level_sizes[level] / batch_groups)
+        pending_children.append([
+            min(batch_span, child_count - b * batch_span)
+            for b in range(batch_count)
+        ])
+        pending_batches.append(batch_count)
+        print(f"Scheduling level {level} (grouping {child_count} chunks)...")
+
+    total_batches = sum(pending_batches)
+    if total_batches == 0:
+        return list(level_0_chunks)
+
+    # Process batches in parallel with rate limiting; one request per worker
+    queue: asyncio.Queue = asyncio.Queue()
+    completed = 0
+
+    # Level 1 batches only need the original paragraphs
+    for b in range(pending_batches[1]):
+        queue.put_nowait((1, b))
+
+    async def worker():
+        nonlocal completed
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            level, b = item
+
+            # Slice groups straight out of the child level's range
+            child_start, child_end = level_ranges[level - 1]
+            start = child_start + b * batch_span
+            end = min(start + batch_span, child_end)
+            groups = [
+                all_chunks[i:min(i + group_size, end)]
+                for i in range(start, end, group_size)
+            ]
+            first = b * batch_groups
+            next_id = level_ranges[level][0] + first
+
+            # Rate limiting happens inside, only for requests actually sent;
+            # the slot caps requests in flight across every shared build
+            async with request_slots:
+                new_chunks = await summarize_chunk_groups(
+                    groups, client, model, next_id, cache_dir, rate_limiter
+                )
+            all_chunks[next_id:next_id + len(new_chunks)] = new_chunks
+
+            pending_batches[level] -= 1
+            if pending_batches[level] == 0:
+                print(f"Level {level} complete: created {level_sizes[level]} summaries")
+
+            # Release parent batches whose children are now all done
+            if level + 1 < len(level_ranges):
+                for index in range(first, first + len(new_chunks)):
+                    parent = index // batch_span
+                    pending_children[level + 1][parent] -= 1
+                    if pending_children[level + 1][parent] == 0:
+                        queue.put_nowait((level + 1, parent))
+
+            completed += 1
+            if completed == total_batches:
+                for _ in range(max_concurrency):
+                    queue.put_nowait(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        raise
 
-    while current_level < max_level and len(current_level_chunks) > 1:
-        print(f"Processing level {current_level + 1} (grouping {len(current_level_chunks)} chunks)...")
+    return all_chunks
 
-        # Group chunks
-        groups = group_chunks(current_level_chunks, group_size)
 
-        # Process groups in parallel with rate limiting
-        max_concurrent = 10
-        semaphore = asyncio.Semaphore(max_concurrent)
+def process_file(file_path: str, config: Dict[str, Any]) -> DocumentCache:
+    """
+    Orchestrate full processing pipeline for a markdown file.
 
-        async def summarize_with_limit(group, chunk_id):
-            async with semaphore:
-                result = await summarize_chunk_group(group, api_key, model, chunk_id)
-                await asyncio.sleep(0.1)  # Rate limiting
-                return result
+    Checks cache first, then parses and builds summary tree if needed.
 
-        # Create tasks for all groups
-        tasks = [
-            summarize_with_limit(group, next_chunk_id + i)
-            for i, group in enumerate(groups)
-        ]
+    Args:
+        file_path: Path to markdown file
+        config: Configuration dictionary
 
-        # Wait for all summaries at this level
-        new_level_chunks = await asyncio.gather(*tasks)
+    Returns:
+        DocumentCache with metadata and all chunks
+    """
+    return asyncio.run(aprocess_file(file_path, config))
 
-        # Add to all chunks and prepare for next level
-        all_chunks.extend(new_level_chunks)
-        current_level_chunks = new_level_chunks
-        next_chunk_id += len(new_level_chunks)
-        current_level += 1
 
-        print(f"Level {current_level} complete: created {len(new_level_chunks)} summaries")
+def process_files(file_paths: List[str], config: Dict[str, Any]) -> List[DocumentCache]:
+    """
+    Process several markdown files concurrently on one event loop.
 
-    return all_chunks
+    All files share a single API client, rate limiter and in-flight request
+    limit, so the configured limits apply to the batch as a whole. If one
+    file fails, the others are cancelled before the client is closed.
 
+    Args:
+        file_paths: Paths to markdown files
+        config: Configuration dictionary
 
-def process_file(file_path: str, config: Dict[str, Any]) -> DocumentCache:
+    Returns:
+        One DocumentCache per file, in the same order as file_paths
     """
-    Orchestrate full processing pipeline for a markdown file.
+    return asyncio.run(_aprocess_files(file_paths, config))
 
-    Checks cache first, then parses and builds summary tree if needed.
+
+async def _aprocess_files(
+    file_paths: List[str],
+    config: Dict[str, Any]
+) -> List[DocumentCache]:
+    """Run aprocess_file for every path with a shared client and limits."""
+    client = create_client(config['openrouter_api_key'])
+    rate_limiter = AsyncRateLimiter(
+        config['requests_per_second'], config['tokens_per_minute']
+    )
+    request_slots = asyncio.Semaphore(config['max_concurrency'])
+    tasks = [
+        asyncio.ensure_future(
+            aprocess_file(path, config, client, rate_limiter, request_slots)
+        )
+        for path in file_paths
+    ]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # Stop the other files before their shared client is closed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        await client.close()
+
+
+async def aprocess_file(
+    file_path: str,
+    config: Dict[str, Any],
+    client: Optional[AsyncOpenAI] = None,
+    rate_limiter: Optional[AsyncRateLimiter] = None,
+    request_slots: Optional[asyncio.Semaphore] = None
+) -> DocumentCache:
+    """
+    Async version of process_file for callers already running an event loop.
+
+    Cache lookup and file reading run in worker threads so they don't block
+    the loop; several files can then be processed with asyncio.gather.
 
     Args:
         file_path: Path to markdown file
         config: Configuration dictionary
+        client: Shared client (None to create one for this file)
+        rate_limiter: Shared rate limiter (None to create one for this file)
+        request_slots: Shared in-flight request limit (None for one per file)
 
     Returns:
         DocumentCache with metadata and all chunks
@@ -221,15 +907,21 @@ def process_file(file_path: str, config: Dict[str, Any]) -> DocumentCache:
     cache_dir = config['cache_dir']
 
     # Check cache first
-    cache = load_cache(file_path, cache_dir)
-    if cache and is_cache_valid(cache, file_path):
+    cache = await asyncio.to_thread(load_valid_cache, file_path, cache_dir)
+    if cache is not None:
         print(f"Using cached summaries for {file_path}")
         return cache
 
     print(f"Processing {file_path}...")
 
+    # Read once, hashing the same bytes that get parsed; the hash is stored
+    # in metadata and never recomputed
+    content, file_hash, mtime_ns, size = await asyncio.to_thread(
+        read_and_hash, file_path
+    )
+
     # Parse markdown
-    level_0_chunks = parse_markdown(file_path)
+    level_0_chunks = parse_markdown_text(content)
     print(f"Parsed {len(level_0_chunks)} paragraphs")
 
     # Build summary tree
@@ -237,25 +929,32 @@ def process_file(file_path: str, config: Dict[str, Any]) -> DocumentCache:
     model = config['model']
     max_level = config['abstraction_levels']
     group_size = config['group_size']
-
-    # Run async tree building
-    all_chunks = asyncio.run(
-        build_summary_tree(level_0_chunks, api_key, model, max_level, group_size)
+    batch_groups = config['batch_groups']
+    requests_per_second = config['requests_per_second']
+    max_concurrency = config['max_concurrency']
+    tokens_per_minute = config['tokens_per_minute']
+
+    all_chunks = await build_summary_tree(
+        level_0_chunks, api_key, model, max_level, group_size, cache_dir,
+        batch_groups, requests_per_second, max_concurrency,
+        tokens_per_minute, client, rate_limiter, request_slots
     )
 
     # Create document cache
     document_cache = {
         "metadata": {
             "filename": file_path,
-            "hash": compute_file_hash(file_path),
+            "hash": file_hash,
+            "mtime_ns": mtime_ns,
+            "size": size,
             "processed_at": datetime.now().isoformat(),
             "model": model
         },
-        "chunks": all_chunks
+        "chunks": [asdict(chunk) for chunk in all_chunks]
     }
 
-    # Save cache
-    save_cache(document_cache, file_path, cache_dir)
+    # Queue cache write (flushed in the background and at exit)
+    mark_dirty(strip_original_text(document_cache), file_path, cache_dir)
     print(f"Processing complete: {len(all_chunks)} total chunks")
 
     return document_cache
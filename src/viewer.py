@@ -2,9 +2,25 @@
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
+# Delay before a slider move is rendered; a drag's events coalesce into one
+SLIDER_DEBOUNCE_MS = 50
+
+# While the mouse holds the slider, render only after the drag pauses this
+# long; releasing the button renders straight away
+SLIDER_DRAG_PAUSE_MS = 150
+
+# MouseWheel delta of one wheel notch (Windows/Tk convention)
+WHEEL_DELTA = 120
+
+# Horizontal space around a card's text: borders, frame and label padding
+CARD_TEXT_INSET = 48
+
+# Wrap length used before the content area has been laid out
+MIN_WRAP_LENGTH = 400
+
 
 @dataclass
 class Colors:
@@ -87,7 +103,8 @@ class ChunkCard(tk.Frame):
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
 
-        self._create_widgets(index, level, max_level)
+        self._create_widgets()
+        self.update_chunk(chunk, index, level, max_level, on_click)
 
     def _on_enter(self, event):
         """Handle mouse enter."""
@@ -99,63 +116,106 @@ class ChunkCard(tk.Frame):
         self.is_hovered = False
         self.config(highlightbackground=Colors.card_border, highlightthickness=1)
 
-    def _create_widgets(self, index: int, level: int, max_level: int):
-        """Create card widgets."""
+    def _on_card_click(self, event):
+        """Handle click anywhere on the card."""
+        if self.on_click:
+            self.on_click()
+
+    def _create_widgets(self):
+        """Create card widgets; their contents are filled in by update_chunk."""
         # Header with title and level indicator
-        header = tk.Frame(self, bg=Colors.bg_secondary, height=50)
-        header.pack(fill=tk.X, side=tk.TOP)
-        header.pack_propagate(False)
+        # Sized by its labels' padding rather than a fixed height
+        self.header = tk.Frame(self, bg=Colors.bg_secondary)
+        self.header.pack(fill=tk.X, side=tk.TOP)
 
         # Title
-        title_text = f"Section {index + 1}" if level > 0 else f"Paragraph {index + 1}"
-        title = tk.Label(
-            header, text=title_text, bg=Colors.bg_secondary,
+        self.title = tk.Label(
+            self.header, bg=Colors.bg_secondary,
             fg=Colors.text_primary, font=("Segoe UI", 11, "bold")
         )
-        title.pack(side=tk.LEFT, padx=12, pady=8)
+        self.title.pack(side=tk.LEFT, padx=12, pady=12)
 
         # Level badge
-        badge_text = f"Level {level}/{max_level}" if level > 0 else "Original"
-        badge = tk.Label(
-            header, text=badge_text, bg=Colors.accent_secondary,
+        self.badge = tk.Label(
+            self.header, bg=Colors.accent_secondary,
             fg="white", font=("Segoe UI", 8), padx=8, pady=2
         )
-        badge.pack(side=tk.RIGHT, padx=12, pady=8)
+        self.badge.pack(side=tk.RIGHT, padx=12, pady=12)
 
         # Content
         content_frame = tk.Frame(self, bg=Colors.bg_primary)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
 
-        # Text widget
-        text_height = min(max(len(self.chunk['content']) // 80 + 1, 3), 8)
-        text_widget = tk.Text(
-            content_frame, wrap=tk.WORD,
-            font=("Segoe UI", 10), height=text_height,
+        # Read-only text: a wrapping Label is far lighter than a tk.Text
+        self.content_label = tk.Label(
+            content_frame, font=("Segoe UI", 10),
             relief=tk.FLAT, bg=Colors.bg_tertiary,
             fg=Colors.text_primary, padx=10, pady=10,
-            borderwidth=0
+            borderwidth=0, justify=tk.LEFT, anchor=tk.NW
         )
-        text_widget.insert('1.0', self.chunk['content'])
-        text_widget.config(state=tk.DISABLED)
-        text_widget.pack(fill=tk.BOTH, expand=True)
-
-        # Footer with interaction hint
-        if self.chunk.get('child_ids') and self.on_click:
-            footer = tk.Frame(self, bg=Colors.bg_secondary, height=40)
-            footer.pack(fill=tk.X, side=tk.BOTTOM)
-            footer.pack_propagate(False)
-
-            hint = tk.Label(
-                footer, text="↙ Click to zoom in", bg=Colors.bg_secondary,
-                fg=Colors.accent_primary, font=("Segoe UI", 9, "italic"),
-                cursor="hand2"
-            )
-            hint.pack(side=tk.LEFT, padx=12, pady=8)
+        self.content_label.pack(fill=tk.BOTH, expand=True)
+
+        # Start wrapped to the viewport (the scrollable frame tracks the
+        # canvas width) so the unwrapped text never sets the card's width
+        self.content_label.config(wraplength=max(
+            self.master.winfo_width() - CARD_TEXT_INSET, MIN_WRAP_LENGTH
+        ))
+
+        # Re-wrap to the available width whenever the card is resized
+        content_frame.bind(
+            "<Configure>",
+            lambda e: self.content_label.config(wraplength=max(e.width - 20, 1))
+        )
+
+        # Footer with interaction hint; only packed for clickable chunks
+        self.footer = tk.Frame(self, bg=Colors.bg_secondary)
+
+        self.hint = tk.Label(
+            self.footer, text="↙ Click to zoom in", bg=Colors.bg_secondary,
+            fg=Colors.accent_primary, font=("Segoe UI", 9, "italic"),
+            cursor="hand2"
+        )
+        self.hint.pack(side=tk.LEFT, padx=12, pady=12)
+
+        # Make card clickable
+        for widget in [self, self.header, self.title, self.footer, self.hint, self.content_label]:
+            widget.bind("<Button-1>", self._on_card_click)
+
+    def update_chunk(self, chunk: Dict, index: int, level: int, max_level: int,
+                     on_click=None):
+        """
+        Show a different chunk in this card, reusing its widgets.
+
+        Args:
+            chunk: Chunk to display
+            index: Position of the card in the current view
+            level: Abstraction level being displayed
+            max_level: Highest abstraction level in the document
+            on_click: Called when a chunk with children is clicked
+        """
+        self.chunk = chunk
+        self.on_click = on_click
+
+        # Title and level badge
+        self.title.config(
+            text=f"Section {index + 1}" if level > 0 else f"Paragraph {index + 1}"
+        )
+        self.badge.config(
+            text=f"Level {level}/{max_level}" if level > 0 else "Original"
+        )
+
+        # Text content
+        self.content_label.config(text=chunk['content'])
+
+        # Footer and cursor depend on whether the chunk can be zoomed into
+        clickable = bool(chunk.get('child_ids') and on_click)
+        if clickable:
+            self.footer.pack(fill=tk.X, side=tk.BOTTOM)
+        else:
+            self.footer.pack_forget()
 
-            # Make card clickable
-            for widget in [self, header, title, footer, hint, text_widget]:
-                widget.bind("<Button-1>", lambda e: self.on_click() if self.on_click else None)
-                widget.config(cursor="hand2" if self.chunk.get('child_ids') else "arrow")
+        for widget in [self, self.header, self.title, self.footer, self.content_label]:
+            widget.config(cursor="hand2" if clickable else "")
 
 
 class SummaryViewer(tk.Tk):
@@ -175,14 +235,44 @@ class SummaryViewer(tk.Tk):
         self.config = config
         self.chunks = document_cache['chunks']
 
-        # Calculate max level from chunks
-        self.max_level = max(chunk['level'] for chunk in self.chunks)
+        # One pass over the chunks builds the id map, the max level and the
+        # render index: chunks bucketed by (level, parent_id), and by
+        # (level, None) for the whole level, each sorted by position
+        self.chunk_id_map = {}
+        self._chunk_index: Dict[Tuple[int, Optional[str]], List[Dict]] = {}
+        max_level = 0
+        for chunk in self.chunks:
+            self.chunk_id_map[chunk['id']] = chunk
+            level = chunk['level']
+            if level > max_level:
+                max_level = level
+            self._chunk_index.setdefault((level, None), []).append(chunk)
+            if chunk.get('parent_id') is not None:
+                self._chunk_index.setdefault((level, chunk['parent_id']), []).append(chunk)
+        for bucket in self._chunk_index.values():
+            bucket.sort(key=lambda c: c['position'])
+
+        self.max_level = max_level
         self.current_level = self.max_level  # Start at highest abstraction
 
+        # Level descriptions, built once so slider updates are a lookup
+        self._level_labels = tuple(
+            "Original text - Full paragraphs" if level == 0
+            else "Most abstract - Complete summary" if level == self.max_level
+            else f"Summary level {level} of {self.max_level}"
+            for level in range(self.max_level + 1)
+        )
+
         # Navigation state
         self.current_parent = None
         self.breadcrumb_trail = []
-        self.chunk_id_map = {chunk['id']: chunk for chunk in self.chunks}
+        self._pending_render = None  # after() id of a debounced slider render
+        self._slider_held = False  # mouse button down on the slider
+        self._rendered_key = None  # (level, parent_id, breadcrumbs) on screen
+
+        # Cards are reused across renders instead of being rebuilt each time
+        self._card_pool: List[ChunkCard] = []
+        self._empty_label: Optional[tk.Label] = None
 
         # Setup window
         filename = document_cache['metadata']['filename']
@@ -200,13 +290,12 @@ class SummaryViewer(tk.Tk):
     def _create_widgets(self):
         """Create and layout UI components."""
         # Top section with file info and controls
-        top_section = tk.Frame(self, bg=Colors.bg_secondary, height=80)
+        top_section = tk.Frame(self, bg=Colors.bg_secondary)
         top_section.pack(fill=tk.X, side=tk.TOP)
-        top_section.pack_propagate(False)
 
         # Left side: file info
         info_frame = tk.Frame(top_section, bg=Colors.bg_secondary)
-        info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=15)
+        info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=18)
 
         filename = self.document_cache['metadata']['filename']
         file_label = tk.Label(
@@ -238,18 +327,15 @@ class SummaryViewer(tk.Tk):
         )
         self.slider.set(self.max_level)
         self.slider.pack(fill=tk.X, pady=(0, 8))
+        self.slider.bind("<ButtonPress-1>", self._on_slider_press)
+        self.slider.bind("<ButtonRelease-1>", self._on_slider_release)
 
-        # Level markers
-        markers_frame = tk.Frame(slider_frame, bg=Colors.bg_primary)
-        markers_frame.pack(fill=tk.X)
-
-        for i in range(self.max_level + 1):
-            label_text = "Original" if i == 0 else f"L{i}"
-            marker = tk.Label(
-                markers_frame, text=label_text, bg=Colors.bg_primary,
-                fg=Colors.text_tertiary, font=("Segoe UI", 8)
-            )
-            marker.pack(side=tk.LEFT, expand=True)
+        # Level markers, drawn on one canvas instead of a Label per level
+        self.markers_canvas = tk.Canvas(
+            slider_frame, height=18, bg=Colors.bg_primary, highlightthickness=0
+        )
+        self.markers_canvas.pack(fill=tk.X)
+        self.markers_canvas.bind("<Configure>", self._draw_level_markers)
 
         # Breadcrumb trail
         self.breadcrumb_frame = tk.Frame(self, bg=Colors.bg_primary, height=30)
@@ -274,19 +360,27 @@ class SummaryViewer(tk.Tk):
             lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         )
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor=tk.NW)
+        window_id = self.canvas.create_window(
+            (0, 0), window=self.scrollable_frame, anchor=tk.NW
+        )
+        # Keep the cards as wide as the viewport; there is no horizontal scroll
+        self.canvas.bind(
+            "<Configure>",
+            lambda e: self.canvas.itemconfigure(window_id, width=e.width)
+        )
         self.canvas.configure(yscrollcommand=scrollbar.set)
 
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Mousewheel binding
+        # Mousewheel binding; the handler ignores wheel events outside the
+        # canvas, which bind_all would otherwise route here too
         self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self._canvas_path = str(self.canvas)
 
         # Status bar
-        status_frame = tk.Frame(self, bg=Colors.bg_secondary, height=40)
+        status_frame = tk.Frame(self, bg=Colors.bg_secondary)
         status_frame.pack(fill=tk.X, side=tk.BOTTOM)
-        status_frame.pack_propagate(False)
 
         self.status_label = tk.Label(
             status_frame, text="Ready", bg=Colors.bg_secondary,
@@ -294,6 +388,18 @@ class SummaryViewer(tk.Tk):
         )
         self.status_label.pack(anchor=tk.W)
 
+    def _draw_level_markers(self, event):
+        """Lay the level markers out evenly across the slider width."""
+        self.markers_canvas.delete("all")
+        count = self.max_level + 1
+        slot = event.width / count
+        for i in range(count):
+            self.markers_canvas.create_text(
+                (i + 0.5) * slot, event.height // 2,
+                text="Original" if i == 0 else f"L{i}",
+                fill=Colors.text_tertiary, font=("Segoe UI", 8)
+            )
+
     def _update_breadcrumbs(self):
         """Update breadcrumb trail display."""
         for widget in self.breadcrumb_frame.winfo_children():
@@ -310,8 +416,17 @@ class SummaryViewer(tk.Tk):
         breadcrumb.pack(anchor=tk.W)
 
     def _on_mousewheel(self, event):
-        """Handle mousewheel scrolling."""
-        self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        """Handle mousewheel scrolling over the content area."""
+        # Pointer must be over the canvas or one of the cards inside it
+        widget = self.winfo_containing(event.x_root, event.y_root)
+        if widget is None:
+            return
+        path = str(widget)
+        if path != self._canvas_path and not path.startswith(self._canvas_path + "."):
+            return
+
+        # Truncate toward zero so small touchpad deltas scroll symmetrically
+        self.canvas.yview_scroll(int(-event.delta / WHEEL_DELTA), "units")
 
     def _on_slider_change(self, value):
         """Handle slider value change."""
@@ -320,65 +435,111 @@ class SummaryViewer(tk.Tk):
             self.current_level = new_level
             self.current_parent = None
             self.breadcrumb_trail = []
-            self.render_level(self.current_level)
 
-    def render_level(self, level: int, parent_id: Optional[str] = None):
+            # Cheap feedback now; rebuild the cards once the drag settles
+            self._update_level_label(new_level)
+            if self._pending_render is not None:
+                self.after_cancel(self._pending_render)
+            delay = SLIDER_DRAG_PAUSE_MS if self._slider_held else SLIDER_DEBOUNCE_MS
+            self._pending_render = self.after(delay, self._render_pending_level)
+
+    def _on_slider_press(self, event):
+        """Note that a drag has started."""
+        self._slider_held = True
+
+    def _on_slider_release(self, event):
+        """Render a pending slider move as soon as the drag ends."""
+        self._slider_held = False
+        if self._pending_render is not None:
+            self._render_pending_level()
+
+    def _render_pending_level(self):
+        """Render the level the slider settled on."""
+        self._pending_render = None
+        self.render_level(self.current_level)
+
+    def _update_level_label(self, level: int):
+        """
+        Update the level description under the file name.
+
+        Args:
+            level: Abstraction level being displayed
+        """
+        self.level_label.config(text=self._level_labels[level])
+
+    def render_level(self, level: int, parent_id: Optional[str] = None,
+                     force: bool = False):
         """
         Render chunks at the specified level.
 
         Args:
             level: Abstraction level to display
             parent_id: Filter by parent (for Phase 2 zoom feature)
+            force: Re-render even if this view is already on screen
         """
-        # Clear current content
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        # A direct render supersedes any debounced slider render
+        if self._pending_render is not None:
+            self.after_cancel(self._pending_render)
+            self._pending_render = None
+
+        # A drag that returns to the level on screen needs no rebuild
+        key = (level, parent_id, tuple(self.breadcrumb_trail))
+        if key == self._rendered_key and not force:
+            return
+        self._rendered_key = key
+
+        # Clear the empty-level placeholder; cards are recycled below
+        if self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
 
         # Update breadcrumbs
         self._update_breadcrumbs()
 
-        # Filter chunks by level (and parent if specified)
-        filtered_chunks = [
-            chunk for chunk in self.chunks
-            if chunk['level'] == level and (parent_id is None or chunk.get('parent_id') == parent_id)
-        ]
-
-        # Sort by position
-        filtered_chunks.sort(key=lambda c: c['position'])
+        # Chunks at this level (and under parent if specified), by position
+        filtered_chunks = self._chunk_index.get((level, parent_id), [])
 
         # Update level label
-        if level == 0:
-            status_text = "Original text - Full paragraphs"
-        elif level == self.max_level:
-            status_text = f"Most abstract - Complete summary"
-        else:
-            status_text = f"Summary level {level} of {self.max_level}"
+        self._update_level_label(level)
 
-        self.level_label.config(text=status_text)
+        # A new view starts at the top; the old offset means nothing in it
+        self.canvas.yview_moveto(0)
 
         # Display chunks
         if not filtered_chunks:
-            no_content = tk.Label(
+            for card in self._card_pool:
+                card.pack_forget()
+            self._empty_label = tk.Label(
                 self.scrollable_frame, text="No content at this level",
                 bg=Colors.bg_primary, fg=Colors.text_tertiary,
                 font=("Segoe UI", 11)
             )
-            no_content.pack(pady=40)
+            self._empty_label.pack(pady=40)
             return
 
-        # Create cards for each chunk
+        # Fill pooled cards first, creating more only when the pool runs short
         for idx, chunk in enumerate(filtered_chunks):
             def make_click_handler(chunk_id):
                 def handler():
                     self._on_chunk_click(chunk_id)
                 return handler
 
-            card = ChunkCard(
-                self.scrollable_frame, chunk, idx, level, self.max_level,
-                on_click=make_click_handler(chunk['id']) if chunk.get('child_ids') else None
-            )
+            on_click = make_click_handler(chunk['id']) if chunk.get('child_ids') else None
+            if idx < len(self._card_pool):
+                card = self._card_pool[idx]
+                card.update_chunk(chunk, idx, level, self.max_level, on_click=on_click)
+            else:
+                card = ChunkCard(
+                    self.scrollable_frame, chunk, idx, level, self.max_level,
+                    on_click=on_click
+                )
+                self._card_pool.append(card)
             card.pack(fill=tk.X, pady=10)
 
+        # Hide pooled cards this level doesn't need
+        for card in self._card_pool[len(filtered_chunks):]:
+            card.pack_forget()
+
         # Update status
         chunk_count = len(filtered_chunks)
         chunk_word = "chunk" if chunk_count == 1 else "chunks"